@@ -87,7 +87,14 @@ class ReviewClassifierAgent:
         self.goal = "Classify hotel review sentiments"
         self.backstory = "Expert in sentiment analysis for hospitality industry"
         self.tools = [SentimentClassificationTool()]
-        self.agent = self._create_agent()
+        self._agent = None
+    
+    @property
+    def agent(self) -> Agent:
+        """Lazily built CrewAI agent"""
+        if self._agent is None:
+            self._agent = self._create_agent()
+        return self._agent
     
     def _create_agent(self) -> Agent:
         return Agent(
@@ -115,7 +122,7 @@ class ReviewClassifierAgent:
     def classify_review(self, review_text: str) -> Dict[str, Any]:
         """Direct classification without CrewAI workflow"""
         try:
-            tool = SentimentClassificationTool()
+            tool = self.tools[0]
             result = tool._run(review_text)
             
             # Parse result
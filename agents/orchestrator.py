@@ -100,44 +100,21 @@ class ReviewProcessingOrchestrator:
             # Step 1: Sentiment Classification
             classification_result = self.classifier_agent.classify_review(review_text)
             sentiment = classification_result.get('sentiment', 'neutral')
-            classification_confidence = classification_result.get('confidence', 0.5)
             
             # Step 2: Score Generation (uses sentiment context)
             scoring_result = self.scorer_agent.score_review(review_text, sentiment)
-            score = scoring_result.get('score', 3.0)
-            scoring_confidence = scoring_result.get('confidence', 0.5)
             
             # Step 3: Title Generation (uses sentiment context)
             title_result = self.title_generator_agent.generate_title(review_text, sentiment)
-            title = title_result.get('title', 'Untitled Review')
-            title_confidence = title_result.get('confidence', 0.5)
             
             # Compile Core Processing Result
             workflow_end = datetime.now()
             processing_time = (workflow_end - workflow_start).total_seconds()
             
-            final_result = {
-                'review_id': review_id,
-                'review_text': review_text,
-                'analysis': {
-                    'sentiment': sentiment,
-                    'sentiment_confidence': classification_confidence,
-                    'score': score,
-                    'score_confidence': scoring_confidence,
-                    'title': title,
-                    'title_confidence': title_confidence,
-                    'overall_confidence': round((classification_confidence + scoring_confidence + title_confidence) / 3, 2)
-                },
-                'processing': {
-                    'processed_at': workflow_end.isoformat(),
-                    'processing_time_seconds': round(processing_time, 2),
-                    'orchestrator': self.name
-                },
-                'raw_results': {
-                    'classification': classification_result,
-                    'scoring': scoring_result
-                }
-            }
+            final_result = self._build_review_result(
+                review_text, review_id, classification_result, scoring_result,
+                title_result, workflow_end, processing_time
+            )
             
             # Update workflow stats
             self.workflow_stats['total_processed'] += 1
@@ -151,25 +128,117 @@ class ReviewProcessingOrchestrator:
             logger.error(f"Single review workflow failed: {str(e)}")
             self.workflow_stats['failed_workflows'] += 1
             
-            return {
-                'review_id': review_id,
-                'review_text': review_text,
-                'analysis': {
-                    'sentiment': 'neutral',
-                    'sentiment_confidence': 0.0,
-                    'score': 3.0,
-                    'score_confidence': 0.0,
-                    'overall_confidence': 0.0
-                },
-                'processing': {
-                    'processed_at': datetime.now().isoformat(),
-                    'processing_time_seconds': 0,
-                    'orchestrator': self.name,
-                    'error': str(e)
-                },
-                'raw_results': {},
-                'stage': 'core_processing_complete'
+            return self._build_failed_review_result(review_text, review_id, e)
+    
+    def process_reviews(self, reviews: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+        """
+        STAGE 1: Core Processing for several reviews at once
+        
+        Same per-review results as process_single_review, but all reviews are
+        scored through one batched scorer call instead of a request each.
+        Expects dicts with 'text' and 'id' keys.
+        """
+        try:
+            workflow_start = datetime.now()
+            logger.info(f"[STAGE 1] Processing {len(reviews)} reviews")
+            
+            texts = [review.get('text', '') for review in reviews]
+            
+            # Step 1: Sentiment Classification
+            classification_results = [self.classifier_agent.classify_review(text) for text in texts]
+            sentiments = [result.get('sentiment', 'neutral') for result in classification_results]
+            
+            # Step 2: Score Generation, batched across all reviews
+            scoring_results = self.scorer_agent.batch_score([
+                {'text': text, 'sentiment': sentiment} for text, sentiment in zip(texts, sentiments)
+            ])
+            
+            # Step 3: Title Generation (uses sentiment context)
+            title_results = [self.title_generator_agent.generate_title(text, sentiment)
+                             for text, sentiment in zip(texts, sentiments)]
+            
+            workflow_end = datetime.now()
+            processing_time = (workflow_end - workflow_start).total_seconds()
+            per_review_time = processing_time / len(reviews) if reviews else 0
+            
+            results = [
+                self._build_review_result(
+                    text, review.get('id'), classification_result, scoring_result,
+                    title_result, workflow_end, per_review_time
+                )
+                for review, text, classification_result, scoring_result, title_result
+                in zip(reviews, texts, classification_results, scoring_results, title_results)
+            ]
+            
+            # Update workflow stats
+            self.workflow_stats['total_processed'] += len(results)
+            self.workflow_stats['successful_workflows'] += len(results)
+            self.workflow_stats['last_run'] = workflow_end.isoformat()
+            
+            logger.info(f"[COMPLETED] {len(results)} review workflows completed in {processing_time:.2f}s")
+            return results
+            
+        except Exception as e:
+            logger.error(f"Batched review workflow failed, processing one by one: {str(e)}")
+            return [self.process_single_review(review.get('text', ''), review.get('id')) for review in reviews]
+    
+    def _build_review_result(self, review_text: str, review_id: Optional[str],
+                             classification_result: Dict[str, Any], scoring_result: Dict[str, Any],
+                             title_result: Dict[str, Any], processed_at: datetime,
+                             processing_time: float) -> Dict[str, Any]:
+        """Compile the core processing result for one review"""
+        sentiment = classification_result.get('sentiment', 'neutral')
+        classification_confidence = classification_result.get('confidence', 0.5)
+        score = scoring_result.get('score', 3.0)
+        scoring_confidence = scoring_result.get('confidence', 0.5)
+        title = title_result.get('title', 'Untitled Review')
+        title_confidence = title_result.get('confidence', 0.5)
+        
+        return {
+            'review_id': review_id,
+            'review_text': review_text,
+            'analysis': {
+                'sentiment': sentiment,
+                'sentiment_confidence': classification_confidence,
+                'score': score,
+                'score_confidence': scoring_confidence,
+                'title': title,
+                'title_confidence': title_confidence,
+                'overall_confidence': round((classification_confidence + scoring_confidence + title_confidence) / 3, 2)
+            },
+            'processing': {
+                'processed_at': processed_at.isoformat(),
+                'processing_time_seconds': round(processing_time, 2),
+                'orchestrator': self.name
+            },
+            'raw_results': {
+                'classification': classification_result,
+                'scoring': scoring_result
             }
+        }
+    
+    def _build_failed_review_result(self, review_text: str, review_id: Optional[str],
+                                    error: Exception) -> Dict[str, Any]:
+        """Neutral placeholder result for a review whose workflow failed"""
+        return {
+            'review_id': review_id,
+            'review_text': review_text,
+            'analysis': {
+                'sentiment': 'neutral',
+                'sentiment_confidence': 0.0,
+                'score': 3.0,
+                'score_confidence': 0.0,
+                'overall_confidence': 0.0
+            },
+            'processing': {
+                'processed_at': datetime.now().isoformat(),
+                'processing_time_seconds': 0,
+                'orchestrator': self.name,
+                'error': str(error)
+            },
+            'raw_results': {},
+            'stage': 'core_processing_complete'
+        }
     
     def _ensure_analytics_agents(self):
         """Lazy initialization of Stage 2 analytics agents"""
@@ -203,16 +272,13 @@ class ReviewProcessingOrchestrator:
             logger.info(f" Starting batch workflow for {len(reviews)} reviews")
             
             # Process Individual Reviews
-            individual_results = []
-            
-            for i, review_data in enumerate(reviews, 1):
-                review_text = review_data.get('text', review_data.get('review_text', ''))
-                review_id = review_data.get('id', f"batch_review_{i}")
-                
-                logger.info(f"Processing review {i}/{len(reviews)}")
-                
-                result = self.process_single_review(review_text, review_id)
-                individual_results.append(result)
+            individual_results = self.process_reviews([
+                {
+                    'text': review_data.get('text', review_data.get('review_text', '')),
+                    'id': review_data.get('id', f"batch_review_{i}")
+                }
+                for i, review_data in enumerate(reviews, 1)
+            ])
             
             #  Generate Collection Summary
             summary_result = None
@@ -234,21 +300,30 @@ class ReviewProcessingOrchestrator:
             workflow_end = datetime.now()
             total_processing_time = (workflow_end - workflow_start).total_seconds()
             
-            # Calculate batch statistics
-            sentiments = [r['analysis']['sentiment'] for r in individual_results]
-            scores = [r['analysis']['score'] for r in individual_results]
+            # Calculate batch statistics in a single pass over the results
+            sentiment_distribution = {'positive': 0, 'negative': 0, 'neutral': 0}
+            score_total = 0.0
+            score_min = score_max = None
+            
+            for r in individual_results:
+                sentiment = r['analysis']['sentiment']
+                if sentiment in sentiment_distribution:
+                    sentiment_distribution[sentiment] += 1
+                
+                score = r['analysis']['score']
+                score_total += score
+                if score_min is None or score < score_min:
+                    score_min = score
+                if score_max is None or score > score_max:
+                    score_max = score
             
             batch_stats = {
                 'total_reviews': len(individual_results),
-                'sentiment_distribution': {
-                    'positive': sentiments.count('positive'),
-                    'negative': sentiments.count('negative'),
-                    'neutral': sentiments.count('neutral')
-                },
+                'sentiment_distribution': sentiment_distribution,
                 'score_statistics': {
-                    'average': round(sum(scores) / len(scores), 2) if scores else 0,
-                    'minimum': min(scores) if scores else 0,
-                    'maximum': max(scores) if scores else 0
+                    'average': round(score_total / len(individual_results), 2) if individual_results else 0,
+                    'minimum': score_min if individual_results else 0,
+                    'maximum': score_max if individual_results else 0
                 }
             }
             
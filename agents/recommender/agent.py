@@ -6,7 +6,6 @@ Uses Google Gemini LLM to generate business recommendations.
 import logging
 from typing import Dict, List, Any, Optional
 from collections import Counter
-import google.generativeai as genai
 from utils.api_config import get_gemini_api_key
 
 logger = logging.getLogger(__name__)
@@ -36,6 +35,8 @@ class ReviewRecommendationsAgent:
             if not api_key:
                 raise ValueError("Gemini API key not found")
             
+            # lazy: heavy grpc import
+            import google.generativeai as genai
             genai.configure(api_key=api_key)
             
             generation_config = {
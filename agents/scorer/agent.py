@@ -14,6 +14,9 @@ import requests
 
 logger = logging.getLogger('agents.scorer')
 
+# Reviews sent to the HuggingFace endpoint per request when batch scoring
+HF_BATCH_SIZE = 16
+
 
 class SentimentScoringTool(BaseTool):
     name: str = "sentiment_scorer"
@@ -41,6 +44,36 @@ class SentimentScoringTool(BaseTool):
         
         return self._fallback_scoring(text, sentiment)
 
+    def _run_batch(self, texts: List[str], sentiments: List[str] = None) -> List[str]:
+        """Score several reviews with one HuggingFace request per batch"""
+        sentiments = sentiments or [None] * len(texts)
+        headers = {"Authorization": f"Bearer {self._api_key}"}
+        results = []
+        
+        for start in range(0, len(texts), HF_BATCH_SIZE):
+            chunk = texts[start:start + HF_BATCH_SIZE]
+            chunk_sentiments = sentiments[start:start + HF_BATCH_SIZE]
+            
+            try:
+                payload = {"inputs": chunk}
+                # Up to HF_BATCH_SIZE inputs per request, so allow longer than _run's 10s
+                response = requests.post(self._api_url, headers=headers, json=payload, timeout=30)
+                
+                if response.status_code == 200:
+                    batch_result = response.json()
+                    # One list of label scores per input text
+                    if isinstance(batch_result, list) and len(batch_result) == len(chunk):
+                        results.extend(self._process_result([item]) for item in batch_result)
+                        continue
+                    
+            except Exception as e:
+                logger.error(f"Batch scoring error: {str(e)}")
+            
+            results.extend(self._fallback_scoring(text, sentiment)
+                           for text, sentiment in zip(chunk, chunk_sentiments))
+        
+        return results
+
     def _process_result(self, result) -> str:
         """Process AI model result"""
         try:
@@ -50,20 +83,10 @@ class SentimentScoringTool(BaseTool):
                 # Calculate weighted score using direct star labels
                 total_score = 0.0
                 for item in scores:
-                    label = item['label']
-                    probability = item['score']
-                    
-                    # Map star labels to scores (1-5 scale)
-                    if '1 star' in label:
-                        total_score += probability * 1.0
-                    elif '2 stars' in label:
-                        total_score += probability * 2.0
-                    elif '3 stars' in label:
-                        total_score += probability * 3.0
-                    elif '4 stars' in label:
-                        total_score += probability * 4.0
-                    elif '5 stars' in label:
-                        total_score += probability * 5.0
+                    # Labels are "1 star" .. "5 stars"; the leading digit is the score
+                    stars = item['label'][:1]
+                    if stars and stars in '12345':
+                        total_score += item['score'] * int(stars)
                 
                 final_score = max(1.0, min(5.0, total_score))
                 return f"Score: {final_score:.1f}"
@@ -104,13 +127,22 @@ class SentimentScoringTool(BaseTool):
 
 #this takes the above tool and wrapts it in a crew ai agent like thing
 class ReviewScorerAgent:
+    _SCORE_PATTERN = re.compile(r'Score:\s*(\d+\.?\d*)')
+    
     def __init__(self):
         self.name = "ReviewScorer"
         self.role = "Review Scoring Specialist"
         self.goal = "Assign numerical scores (1-5) to hotel reviews"
         self.backstory = "Expert in converting customer feedback into satisfaction scores"
         self.tools = [SentimentScoringTool()]
-        self.agent = self._create_agent()
+        self._agent = None
+    
+    @property
+    def agent(self) -> Agent:
+        """Lazily built CrewAI agent"""
+        if self._agent is None:
+            self._agent = self._create_agent()
+        return self._agent
     
     def _create_agent(self) -> Agent:
         return Agent(
@@ -139,11 +171,11 @@ class ReviewScorerAgent:
     def score_review(self, review_text: str, sentiment: str = None) -> Dict[str, Any]:
         """Direct scoring without CrewAI workflow"""
         try:
-            tool = SentimentScoringTool()
+            tool = self.tools[0]
             result = tool._run(review_text, sentiment)
             
             # Parse score
-            score_match = re.search(r'Score:\s*(\d+\.?\d*)', result)
+            score_match = self._SCORE_PATTERN.search(result)
             score = float(score_match.group(1)) if score_match else 3.0
             
             return {
@@ -161,6 +193,23 @@ class ReviewScorerAgent:
             }
 
     def batch_score(self, reviews_with_sentiment: List[Dict]) -> List[Dict[str, Any]]:
-        """Score multiple reviews"""
-        return [self.score_review(review.get('text', ''), review.get('sentiment', '')) 
-                for review in reviews_with_sentiment]
\ No newline at end of file
+        """Score multiple reviews, batching the HuggingFace requests"""
+        texts = [review.get('text', '') for review in reviews_with_sentiment]
+        sentiments = [review.get('sentiment', '') for review in reviews_with_sentiment]
+        
+        try:
+            results = self.tools[0]._run_batch(texts, sentiments)
+        except Exception as e:
+            logger.error(f"Batch scoring failed: {str(e)}")
+            return [self.score_review(text, sentiment) for text, sentiment in zip(texts, sentiments)]
+        
+        scored = []
+        for result, sentiment in zip(results, sentiments):
+            score_match = self._SCORE_PATTERN.search(result)
+            scored.append({
+                'score': float(score_match.group(1)) if score_match else 3.0,
+                'sentiment': sentiment or 'neutral',
+                'raw_result': result
+            })
+        
+        return scored
\ No newline at end of file
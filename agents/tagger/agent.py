@@ -3,14 +3,93 @@ AI-Powered Tags Generator Agent for Topic & Theme Analysis
 Uses Google Gemini LLM to generate keywords and topics from review data.
 """
 
-import json
 import logging
-from typing import List, Dict, Any
-import google.generativeai as genai
+import re
+from typing import List, Dict, Any, Tuple
+import orjson
 from utils.api_config import get_gemini_api_key
+from utils.result_cache import DigestLRUCache
 
 logger = logging.getLogger(__name__)
 
+# Successful Gemini responses keyed by a hash of the input reviews. Shared at
+# module level because views build a fresh orchestrator per request.
+TAGS_CACHE_SIZE = 32
+_tags_cache = DigestLRUCache(TAGS_CACHE_SIZE)
+
+# Leading/trailing markdown code fences around Gemini JSON output
+_JSON_FENCE_PATTERN = re.compile(r'^```(?:json)?\s*|\s*```$')
+
+# Upper bound on serialized review bytes embedded in the tags prompt
+TAGS_PROMPT_BUDGET = 24000
+
+# Head of the tags prompt, filled per call with str.format
+TAGS_PROMPT_HEADER = """
+Analyze these {count} hotel reviews and provide topic analysis in JSON format:
+
+Reviews: {reviews}
+"""
+
+# Static tail of the tags prompt
+TAGS_PROMPT_INSTRUCTIONS = """
+Return JSON with:
+{
+    "positive_keywords": ["keyword1", "keyword2", "keyword3", "keyword4", "keyword5"],
+    "negative_keywords": ["keyword1", "keyword2", "keyword3", "keyword4", "keyword5"],
+    "topic_metrics": {
+        "service": {
+            "percentage": 85,
+            "keywords": ["staff", "support", "help"],
+            "description": "Service quality analysis"
+        },
+        "cleanliness": {
+            "percentage": 78,
+            "keywords": ["clean", "hygiene", "tidy"],
+            "description": "Cleanliness standards analysis"
+        },
+        "location": {
+            "percentage": 90,
+            "keywords": ["area", "transport", "access"],
+            "description": "Location convenience analysis"
+        }
+    },
+    "main_issues": ["issue1", "issue2", "issue3"],
+    "emerging_topics": ["topic1", "topic2", "topic3"]
+}
+
+Extract actual keywords from review texts and provide realistic percentages.
+"""
+
+# Served whenever Gemini is unavailable; serialized once at import
+_FALLBACK_TAGS_JSON = orjson.dumps({
+    "positive_keywords": ["excellent", "clean", "friendly", "comfortable", "convenient"],
+    "negative_keywords": ["dirty", "noise", "rude", "expensive", "disappointing"],
+    "topic_metrics": {
+        "service": {
+            "percentage": 75,
+            "keywords": ["staff", "support", "help"],
+            "description": "Service quality analysis"
+        },
+        "cleanliness": {
+            "percentage": 70,
+            "keywords": ["clean", "hygiene", "tidy"],
+            "description": "Cleanliness standards analysis"
+        },
+        "location": {
+            "percentage": 80,
+            "keywords": ["area", "transport", "access"],
+            "description": "Location convenience analysis"
+        }
+    },
+    "main_issues": ["service issues", "cleanliness concerns", "noise problems"],
+    "emerging_topics": ["technology concerns", "health safety", "value for money"]
+})
+
+
+def _fallback_tags() -> Dict[str, Any]:
+    """Fresh copy of the fallback tags, safe for callers to mutate"""
+    return orjson.loads(_FALLBACK_TAGS_JSON)
+
 
 class BaseTool:
     """Simple base class to replace langchain BaseTool"""
@@ -35,6 +114,8 @@ class GeminiTagsGeneratorTool(BaseTool):
         try:
             api_key = get_gemini_api_key()
             if api_key:
+                # lazy: heavy grpc import
+                import google.generativeai as genai
                 genai.configure(api_key=api_key)
                 object.__setattr__(self, 'model', genai.GenerativeModel('gemini-2.0-flash-exp'))
                 logger.info("Gemini model initialized successfully for tags generation")
@@ -47,100 +128,89 @@ class GeminiTagsGeneratorTool(BaseTool):
 
     def _run(self, reviews_data: str) -> str:
         """Generate topic analysis from reviews using Gemini"""
+        try:
+            reviews = orjson.loads(reviews_data)
+        except orjson.JSONDecodeError:
+            logger.error("Invalid reviews JSON passed to tags generator")
+            return self._get_fallback_response()
+        
+        return orjson.dumps(self._generate(reviews)).decode()
+
+    def _generate(self, reviews: List[Dict]) -> Dict[str, Any]:
+        """Generate topic analysis as a dict, parsing the Gemini output once"""
         try:
             if not hasattr(self, 'model') or not self.model:
-                return self._get_fallback_response()
+                return _fallback_tags()
             
-            reviews = json.loads(reviews_data)
-            # Generate AI-powered tags for reviews
+            cache_key = _tags_cache.key(orjson.dumps(reviews))
+            cached = _tags_cache.get(cache_key)
+            if cached is not None:
+                logger.info("AI tags served from cache")
+                return orjson.loads(cached)
             
-            prompt = f"""
-            Analyze these {len(reviews)} hotel reviews and provide topic analysis in JSON format:
-
-            Reviews: {json.dumps(reviews[:50], indent=2)}
-
-            Return JSON with:
-            {{
-                "positive_keywords": ["keyword1", "keyword2", "keyword3", "keyword4", "keyword5"],
-                "negative_keywords": ["keyword1", "keyword2", "keyword3", "keyword4", "keyword5"],
-                "topic_metrics": {{
-                    "service": {{
-                        "percentage": 85,
-                        "keywords": ["staff", "support", "help"],
-                        "description": "Service quality analysis"
-                    }},
-                    "cleanliness": {{
-                        "percentage": 78,
-                        "keywords": ["clean", "hygiene", "tidy"],  
-                        "description": "Cleanliness standards analysis"
-                    }},
-                    "location": {{
-                        "percentage": 90,
-                        "keywords": ["area", "transport", "access"],
-                        "description": "Location convenience analysis"
-                    }}
-                }},
-                "main_issues": ["issue1", "issue2", "issue3"],
-                "emerging_topics": ["topic1", "topic2", "topic3"]
-            }}
-
-            Extract actual keywords from review texts and provide realistic percentages.
-            """
+            # Generate AI-powered tags for reviews
+            packed_reviews, packed_count = self._pack_reviews(reviews)
+            prompt = TAGS_PROMPT_HEADER.format(
+                count=packed_count, reviews=packed_reviews
+            ) + TAGS_PROMPT_INSTRUCTIONS
             
             response = self.model.generate_content(prompt)
             
             if response and response.text:
-                response_text = response.text.strip()
-                
                 # Clean markdown formatting
-                if response_text.startswith('```json'):
-                    response_text = response_text[7:]
-                if response_text.endswith('```'):
-                    response_text = response_text[:-3]
-                response_text = response_text.strip()
+                response_text = _JSON_FENCE_PATTERN.sub('', response.text.strip())
                 
-                # Validate JSON
+                # Validate JSON; the parsed result is returned as-is
                 try:
-                    json.loads(response_text)
-                    logger.info("AI tags generation completed successfully")
-                    return response_text
-                except json.JSONDecodeError:
+                    tags_data = orjson.loads(response_text)
+                except orjson.JSONDecodeError:
                     logger.error("Invalid JSON in Gemini response")
-                    return self._get_fallback_response()
-            else:
-                return self._get_fallback_response()
+                    return _fallback_tags()
+                
+                logger.info("AI tags generation completed successfully")
+                _tags_cache.put(cache_key, response_text)
+                return tags_data
+            
+            return _fallback_tags()
                 
         except Exception as e:
             logger.error(f"Error in AI tags generation: {str(e)}")
-            return self._get_fallback_response()
+            return _fallback_tags()
+
+    def _pack_reviews(self, reviews: List[Dict]) -> Tuple[str, int]:
+        """Serialize reviews for the prompt until TAGS_PROMPT_BUDGET is used up.
+        
+        Returns the JSON array and the number of reviews it holds.
+        """
+        parts = []
+        used = 0
+        for review in reviews:
+            encoded = orjson.dumps(review)
+            if used + len(encoded) > TAGS_PROMPT_BUDGET:
+                if parts:
+                    break
+                # A lone oversized review is shortened rather than dropped
+                encoded = self._shorten_review(review, TAGS_PROMPT_BUDGET)
+            parts.append(encoded)
+            used += len(encoded) + 1
+        
+        return (b'[' + b','.join(parts) + b']').decode(), len(parts)
+
+    def _shorten_review(self, review: Dict, budget: int) -> bytes:
+        """Cut a review's text until its serialized form fits in budget bytes"""
+        text = review.get('text') or ''
+        base = len(orjson.dumps({**review, 'text': ''}))
+        room = budget - base
+        while True:
+            encoded = orjson.dumps({**review, 'text': text[:max(room, 0)]})
+            if len(encoded) <= budget or room <= 0:
+                return encoded
+            # Escapes and multi-byte characters take more than a byte each
+            room = room * (budget - base) // (len(encoded) - base)
 
     def _get_fallback_response(self) -> str:
         """Return fallback response if AI generation fails"""
-        fallback = {
-            "positive_keywords": ["excellent", "clean", "friendly", "comfortable", "convenient"],
-            "negative_keywords": ["dirty", "noise", "rude", "expensive", "disappointing"],
-            "topic_metrics": {
-                "service": {
-                    "percentage": 75,
-                    "keywords": ["staff", "support", "help"],
-                    "description": "Service quality analysis"
-                },
-                "cleanliness": {
-                    "percentage": 70,
-                    "keywords": ["clean", "hygiene", "tidy"],
-                    "description": "Cleanliness standards analysis"
-                },
-                "location": {
-                    "percentage": 80,
-                    "keywords": ["area", "transport", "access"],
-                    "description": "Location convenience analysis"
-                }
-            },
-            "main_issues": ["service issues", "cleanliness concerns", "noise problems"],
-            "emerging_topics": ["technology concerns", "health safety", "value for money"]
-        }
-        
-        return json.dumps(fallback, indent=2)
+        return _FALLBACK_TAGS_JSON.decode()
 
 
 class TagsGeneratorAgent:
@@ -163,14 +233,8 @@ class TagsGeneratorAgent:
                 logger.warning("No review data provided for tags generation")
                 return self._get_default_tags()
             
-            # Convert reviews data to JSON string for the tool
-            reviews_json = json.dumps(reviews_data)
-            
-            # Use the Gemini tool to generate tags
-            result = self.tool._run(reviews_json)
-            
-            # Parse the result
-            tags_data = json.loads(result)
+            # Call the tool in-process; _run's JSON string contract is only for CrewAI
+            tags_data = self.tool._generate(reviews_data)
             
             logger.info(f"Tags generation completed for {len(reviews_data)} reviews")
             return tags_data
@@ -7,13 +7,142 @@ import json
 import logging
 import os
 import re
+import zlib
 from typing import Dict, Any, List
 from crewai import Agent, Task
 from crewai.tools import BaseTool
 import requests
+from utils.result_cache import DigestLRUCache
 
 logger = logging.getLogger('agents.title_generator')
 
+# Generated titles keyed by a digest of (text, sentiment)
+TITLE_CACHE_SIZE = 4096
+_title_cache = DigestLRUCache(TITLE_CACHE_SIZE)
+
+# Regexes used on every title, compiled once at import
+_CLEAN_PATTERN = re.compile(r'[^\w\s.,!?-]')
+_SENTENCE_SPLIT_PATTERN = re.compile(r'[.!?]+')
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+_SUMMARY_PREFIX_PATTERN = re.compile(r'^(The|This|It|Hotel|Review|Guest|Customer)\s+', re.IGNORECASE)
+_SUMMARY_SUFFIX_PATTERN = re.compile(r'\s+(says|mentions|states|reports|review|hotel)\s*$', re.IGNORECASE)
+
+# Key phrase patterns, matched against lowercased review text. Each pattern
+# starts with one of its trigger words, so a plain substring check on those
+# words rules a pattern out before its regex runs.
+_KEY_PHRASE_SPECS = [
+    # Hotel experience patterns
+    (('amazing', 'excellent', 'outstanding', 'perfect', 'great', 'wonderful'), r'\s+([\w\s]{1,30})', 'positive'),
+    (('terrible', 'awful', 'horrible', 'disappointing', 'poor', 'bad'), r'\s+([\w\s]{1,30})', 'negative'),
+    (('love', 'loved', 'enjoyed', 'impressed', 'delighted'), r'\s+([\w\s]{1,30})', 'positive'),
+    (('hate', 'hated', 'disliked', 'frustrated', 'disappointed'), r'\s+([\w\s]{1,30})', 'negative'),
+    (('best', 'worst', 'favorite', 'favourite'), r'\s+([\w\s]{1,30})', 'neutral'),
+    # Service and amenity patterns
+    (('staff', 'service', 'reception', 'concierge'), r'\s+(was|were)\s+([\w\s]{1,25})', 'service'),
+    (('room', 'rooms', 'accommodation'), r'\s+(was|were)\s+([\w\s]{1,25})', 'room'),
+    (('breakfast', 'food', 'restaurant', 'dining'), r'\s+(was|were)\s+([\w\s]{1,25})', 'dining'),
+    (('location', 'area', 'neighborhood'), r'\s+(is|was)\s+([\w\s]{1,25})', 'location'),
+    (('wifi', 'internet', 'connection'), r'\s+(was|were)\s+([\w\s]{1,25})', 'amenities'),
+    (('pool', 'gym', 'spa', 'facilities'), r'\s+(was|were)\s+([\w\s]{1,25})', 'facilities'),
+]
+_KEY_PHRASE_PATTERNS = [
+    (triggers, re.compile(f"({'|'.join(triggers)}){tail}"), category)
+    for triggers, tail, category in _KEY_PHRASE_SPECS
+]
+
+# Filler phrases stripped from candidate titles, in removal order
+_UNNECESSARY_PHRASES = ('the hotel', 'this hotel', 'i think', 'i feel', 'i believe',
+                        'we had', 'we were', 'it was', 'there was', 'there were')
+
+# Words dropped from generated titles (after the first word)
+_TITLE_SKIP_WORDS = frozenset({'a', 'an', 'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to',
+                               'for', 'of', 'with', 'was', 'were', 'is', 'are'})
+
+# Words kept lowercase when title-casing summary text
+_TITLE_CASE_MINOR_WORDS = frozenset({'a', 'an', 'the', 'and', 'or', 'but', 'in', 'on', 'at',
+                                     'to', 'for', 'of', 'with'})
+
+# Sentiment words that make a title self-describing
+_SENTIMENT_WORDS = ('amazing', 'excellent', 'great', 'wonderful', 'perfect', 'outstanding',
+                    'terrible', 'awful', 'poor', 'bad', 'horrible', 'disappointing',
+                    'good', 'nice', 'decent', 'average', 'okay')
+
+# Words prefixed to intelligent titles that lack sentiment
+_TITLE_ENHANCERS = {
+    'positive': ['Excellent', 'Great', 'Amazing', 'Wonderful'],
+    'negative': ['Poor', 'Disappointing', 'Terrible', 'Bad'],
+    'neutral': ['Average', 'Decent', 'Standard'],
+}
+
+# Words prefixed to AI titles that lack sentiment
+_SENTIMENT_ENHANCERS = {
+    'positive': ['Great', 'Excellent', 'Amazing', 'Perfect', 'Outstanding'],
+    'negative': ['Poor', 'Terrible', 'Disappointing', 'Awful', 'Bad'],
+    'neutral': ['Average', 'Decent', 'Okay', 'Standard', 'Typical']
+}
+_SENTIMENT_ENHANCER_WORDS = tuple(word.lower() for words in _SENTIMENT_ENHANCERS.values() for word in words)
+
+# Fallback title keywords per hotel aspect; the first aspect wins ties
+_HOTEL_ASPECTS = {
+    'service': ['service', 'staff', 'reception', 'concierge', 'help', 'assistance'],
+    'room': ['room', 'bedroom', 'suite', 'accommodation', 'bed', 'bathroom'],
+    'food': ['food', 'breakfast', 'dinner', 'restaurant', 'dining', 'meal', 'buffet'],
+    'location': ['location', 'area', 'neighborhood', 'downtown', 'center', 'beach', 'city'],
+    'cleanliness': ['clean', 'dirty', 'hygiene', 'sanitized', 'spotless', 'tidy'],
+    'value': ['price', 'value', 'money', 'cost', 'expensive', 'cheap', 'affordable'],
+    'amenities': ['wifi', 'pool', 'gym', 'spa', 'parking', 'elevator', 'air conditioning'],
+    'comfort': ['comfortable', 'cozy', 'spacious', 'quiet', 'peaceful', 'relaxing']
+}
+
+# Fallback titles per aspect and sentiment
+_ASPECT_TITLES = {
+    'service': {
+        'positive': ['Excellent Service', 'Outstanding Staff', 'Great Service Experience'],
+        'negative': ['Poor Service', 'Disappointing Staff', 'Terrible Customer Service'],
+        'neutral': ['Average Service', 'Standard Staff', 'Decent Service']
+    },
+    'room': {
+        'positive': ['Amazing Rooms', 'Perfect Accommodation', 'Excellent Room Quality'],
+        'negative': ['Poor Room Conditions', 'Disappointing Rooms', 'Terrible Accommodation'],
+        'neutral': ['Average Rooms', 'Standard Accommodation', 'Decent Room']
+    },
+    'food': {
+        'positive': ['Excellent Dining', 'Amazing Breakfast', 'Outstanding Food'],
+        'negative': ['Poor Food Quality', 'Disappointing Breakfast', 'Terrible Dining'],
+        'neutral': ['Average Food', 'Standard Dining', 'Decent Breakfast']
+    },
+    'location': {
+        'positive': ['Perfect Location', 'Excellent Area', 'Great Location Choice'],
+        'negative': ['Poor Location', 'Disappointing Area', 'Bad Location'],
+        'neutral': ['Average Location', 'Standard Area', 'Decent Location']
+    },
+    'cleanliness': {
+        'positive': ['Spotless Hotel', 'Excellent Cleanliness', 'Very Clean'],
+        'negative': ['Poor Hygiene', 'Dirty Conditions', 'Cleanliness Issues'],
+        'neutral': ['Average Cleanliness', 'Standard Hygiene', 'Decent Cleaning']
+    },
+    'value': {
+        'positive': ['Excellent Value', 'Great Price Point', 'Worth Every Penny'],
+        'negative': ['Poor Value', 'Overpriced Stay', 'Not Worth Money'],
+        'neutral': ['Average Value', 'Fair Pricing', 'Decent Value']
+    },
+    'amenities': {
+        'positive': ['Great Amenities', 'Excellent Facilities', 'Amazing Features'],
+        'negative': ['Poor Amenities', 'Disappointing Facilities', 'Lacking Features'],
+        'neutral': ['Average Amenities', 'Standard Facilities', 'Decent Features']
+    },
+    'comfort': {
+        'positive': ['Very Comfortable', 'Extremely Relaxing', 'Perfect Comfort'],
+        'negative': ['Uncomfortable Stay', 'Poor Comfort', 'Unpleasant Experience'],
+        'neutral': ['Average Comfort', 'Standard Relaxation', 'Decent Comfort']
+    }
+}
+
+
+def _pick(options: List[str], key: str) -> str:
+    """Choose one of options, stable for a given key so repeated reviews get the same title"""
+    return options[zlib.crc32(key.encode('utf-8')) % len(options)]
+
 
 class TitleGenerationTool(BaseTool):
     name: str = "title_generator"
@@ -26,6 +155,15 @@ class TitleGenerationTool(BaseTool):
 
     def _run(self, text: str, sentiment: str = None) -> str:
         """Generate title using advanced text analysis"""
+        cache_key = _title_cache.key(json.dumps([text, sentiment]).encode('utf-8'))
+        result = _title_cache.get(cache_key)
+        if result is None:
+            result = self._generate_title(text, sentiment)
+            _title_cache.put(cache_key, result)
+        return result
+
+    def _generate_title(self, text: str, sentiment: str = None) -> str:
+        """Uncached title generation behind _run"""
         try:
             # Use intelligent title generation (disable HuggingFace for reliability)
             title = self._intelligent_title_generation(text, sentiment)
@@ -45,8 +183,8 @@ class TitleGenerationTool(BaseTool):
             return "Short Review"
         
         # Clean and prepare text
-        text_clean = re.sub(r'[^\w\s.,!?-]', '', text)
-        sentences = re.split(r'[.!?]+', text_clean)
+        text_clean = _CLEAN_PATTERN.sub('', text)
+        sentences = _SENTENCE_SPLIT_PATTERN.split(text_clean)
         
         # Find the most important sentence/phrase
         important_phrases = self._extract_key_phrases(text_clean)
@@ -68,34 +206,15 @@ class TitleGenerationTool(BaseTool):
         phrases = []
         text_lower = text.lower()
         
-        # Hotel experience patterns
-        experience_patterns = [
-            (r'(amazing|excellent|outstanding|perfect|great|wonderful)\s+([\w\s]{1,30})', 'positive'),
-            (r'(terrible|awful|horrible|disappointing|poor|bad)\s+([\w\s]{1,30})', 'negative'),
-            (r'(love|loved|enjoyed|impressed|delighted)\s+([\w\s]{1,30})', 'positive'),
-            (r'(hate|hated|disliked|frustrated|disappointed)\s+([\w\s]{1,30})', 'negative'),
-            (r'(best|worst|favorite|favourite)\s+([\w\s]{1,30})', 'neutral'),
-        ]
-        
-        # Service and amenity patterns
-        amenity_patterns = [
-            (r'(staff|service|reception|concierge)\s+(was|were)\s+([\w\s]{1,25})', 'service'),
-            (r'(room|rooms|accommodation)\s+(was|were)\s+([\w\s]{1,25})', 'room'),
-            (r'(breakfast|food|restaurant|dining)\s+(was|were)\s+([\w\s]{1,25})', 'dining'),
-            (r'(location|area|neighborhood)\s+(is|was)\s+([\w\s]{1,25})', 'location'),
-            (r'(wifi|internet|connection)\s+(was|were)\s+([\w\s]{1,25})', 'amenities'),
-            (r'(pool|gym|spa|facilities)\s+(was|were)\s+([\w\s]{1,25})', 'facilities'),
-        ]
-        
         # Check patterns and extract phrases
-        all_patterns = experience_patterns + amenity_patterns
-        
-        for pattern, category in all_patterns:
-            matches = re.finditer(pattern, text_lower)
+        for triggers, pattern, category in _KEY_PHRASE_PATTERNS:
+            if not any(word in text_lower for word in triggers):
+                continue
+            matches = pattern.finditer(text_lower)
             for match in matches:
                 if len(match.groups()) >= 2:
                     phrase = f"{match.group(1).title()} {match.group(2).title()}"
-                    phrase = re.sub(r'\s+', ' ', phrase).strip()
+                    phrase = _WHITESPACE_PATTERN.sub(' ', phrase).strip()
                     if 5 <= len(phrase) <= 40:
                         phrases.append(phrase)
         
@@ -127,15 +246,12 @@ class TitleGenerationTool(BaseTool):
         
         # Clean the title
         title = base_title.strip()
-        title = re.sub(r'\s+', ' ', title)
+        title = _WHITESPACE_PATTERN.sub(' ', title)
         
         # Remove common unnecessary words
-        unnecessary_words = ['the hotel', 'this hotel', 'i think', 'i feel', 'i believe', 
-                           'we had', 'we were', 'it was', 'there was', 'there were']
-        
         title_lower = title.lower()
-        for word in unnecessary_words:
-            title_lower = title_lower.replace(word, '')
+        for phrase in _UNNECESSARY_PHRASES:
+            title_lower = title_lower.replace(phrase, '')
         
         # Rebuild title with proper capitalization
         words = title_lower.split()
@@ -144,10 +260,9 @@ class TitleGenerationTool(BaseTool):
         
         # Keep only meaningful words (max 4-5 words)
         meaningful_words = []
-        skip_words = ['a', 'an', 'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'was', 'were', 'is', 'are']
         
         for word in words[:8]:  # Look at first 8 words
-            if word not in skip_words or len(meaningful_words) == 0:
+            if word not in _TITLE_SKIP_WORDS or len(meaningful_words) == 0:
                 meaningful_words.append(word.capitalize())
                 if len(meaningful_words) >= 4:
                     break
@@ -169,22 +284,12 @@ class TitleGenerationTool(BaseTool):
     
     def _has_sentiment_word(self, title: str) -> bool:
         """Check if title already has sentiment words"""
-        sentiment_words = ['amazing', 'excellent', 'great', 'wonderful', 'perfect', 'outstanding',
-                          'terrible', 'awful', 'poor', 'bad', 'horrible', 'disappointing',
-                          'good', 'nice', 'decent', 'average', 'okay']
-        return any(word in title.lower() for word in sentiment_words)
+        return any(map(title.lower().__contains__, _SENTIMENT_WORDS))
     
     def _add_sentiment_enhancement(self, title: str, sentiment: str) -> str:
         """Add appropriate sentiment enhancement"""
-        if sentiment == 'positive':
-            enhancers = ['Excellent', 'Great', 'Amazing', 'Wonderful']
-        elif sentiment == 'negative':
-            enhancers = ['Poor', 'Disappointing', 'Terrible', 'Bad']
-        else:
-            enhancers = ['Average', 'Decent', 'Standard']
-        
-        import random
-        enhancer = random.choice(enhancers)
+        enhancers = _TITLE_ENHANCERS.get(sentiment, _TITLE_ENHANCERS['neutral'])
+        enhancer = _pick(enhancers, title)
         
         # Only add if title doesn't already start with sentiment
         if not any(title.lower().startswith(word.lower()) for word in enhancers):
@@ -239,8 +344,8 @@ class TitleGenerationTool(BaseTool):
             return ""
         
         # Remove common summary artifacts
-        text = re.sub(r'^(The|This|It|Hotel|Review|Guest|Customer)\s+', '', text, flags=re.IGNORECASE)
-        text = re.sub(r'\s+(says|mentions|states|reports|review|hotel)\s*$', '', text, flags=re.IGNORECASE)
+        text = _SUMMARY_PREFIX_PATTERN.sub('', text)
+        text = _SUMMARY_SUFFIX_PATTERN.sub('', text)
         
         # Capitalize first letter of each word (title case)
         words = text.split()
@@ -248,7 +353,7 @@ class TitleGenerationTool(BaseTool):
         
         for word in words[:4]:  
             # Skip articles and prepositions for title case
-            if word.lower() not in ['a', 'an', 'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with']:
+            if word.lower() not in _TITLE_CASE_MINOR_WORDS:
                 formatted_words.append(word.capitalize())
             else:
                 formatted_words.append(word.lower())
@@ -263,26 +368,16 @@ class TitleGenerationTool(BaseTool):
 
     def _enhance_with_sentiment(self, title: str, sentiment: str) -> str:
         """Enhance title based on sentiment"""
-        sentiment_enhancers = {
-            'positive': ['Great', 'Excellent', 'Amazing', 'Perfect', 'Outstanding'],
-            'negative': ['Poor', 'Terrible', 'Disappointing', 'Awful', 'Bad'],
-            'neutral': ['Average', 'Decent', 'Okay', 'Standard', 'Typical']
-        }
-        
         # If title doesn't already convey sentiment, add enhancement
-        if sentiment.lower() in sentiment_enhancers:
-            enhancers = sentiment_enhancers[sentiment.lower()]
+        if sentiment.lower() in _SENTIMENT_ENHANCERS:
+            enhancers = _SENTIMENT_ENHANCERS[sentiment.lower()]
             
             # Check if title already has sentiment words
-            has_sentiment = any(enhancer.lower() in title.lower() for enhancer in 
-                              sentiment_enhancers['positive'] + 
-                              sentiment_enhancers['negative'] + 
-                              sentiment_enhancers['neutral'])
+            has_sentiment = any(map(title.lower().__contains__, _SENTIMENT_ENHANCER_WORDS))
             
             if not has_sentiment and title:
                 # Add appropriate sentiment word
-                import random
-                enhancer = random.choice(enhancers)
+                enhancer = _pick(enhancers, title)
                 title = f"{enhancer} {title}"
         
         return title
@@ -294,97 +389,50 @@ class TitleGenerationTool(BaseTool):
         
         text_lower = text.lower()
         
-        # Advanced keyword detection
-        hotel_aspects = {
-            'service': ['service', 'staff', 'reception', 'concierge', 'help', 'assistance'],
-            'room': ['room', 'bedroom', 'suite', 'accommodation', 'bed', 'bathroom'],
-            'food': ['food', 'breakfast', 'dinner', 'restaurant', 'dining', 'meal', 'buffet'],
-            'location': ['location', 'area', 'neighborhood', 'downtown', 'center', 'beach', 'city'],
-            'cleanliness': ['clean', 'dirty', 'hygiene', 'sanitized', 'spotless', 'tidy'],
-            'value': ['price', 'value', 'money', 'cost', 'expensive', 'cheap', 'affordable'],
-            'amenities': ['wifi', 'pool', 'gym', 'spa', 'parking', 'elevator', 'air conditioning'],
-            'comfort': ['comfortable', 'cozy', 'spacious', 'quiet', 'peaceful', 'relaxing']
-        }
-        
         # Find the most relevant aspect
         aspect_scores = {}
-        for aspect, keywords in hotel_aspects.items():
-            score = sum(1 for keyword in keywords if keyword in text_lower)
+        for aspect, keywords in _HOTEL_ASPECTS.items():
+            score = sum(map(text_lower.__contains__, keywords))
             if score > 0:
                 aspect_scores[aspect] = score
         
         # Generate title based on top aspect and sentiment
         if aspect_scores:
             top_aspect = max(aspect_scores.keys(), key=lambda x: aspect_scores[x])
-            title = self._create_aspect_title(top_aspect, sentiment)
+            title = self._create_aspect_title(top_aspect, sentiment, text)
         else:
             title = self._get_sentiment_title(sentiment)
         
         return f"Title: {title}"
     
-    def _create_aspect_title(self, aspect: str, sentiment: str) -> str:
+    def _create_aspect_title(self, aspect: str, sentiment: str, text: str = '') -> str:
         """Create title based on aspect and sentiment"""
-        aspect_titles = {
-            'service': {
-                'positive': ['Excellent Service', 'Outstanding Staff', 'Great Service Experience'],
-                'negative': ['Poor Service', 'Disappointing Staff', 'Terrible Customer Service'],
-                'neutral': ['Average Service', 'Standard Staff', 'Decent Service']
-            },
-            'room': {
-                'positive': ['Amazing Rooms', 'Perfect Accommodation', 'Excellent Room Quality'],
-                'negative': ['Poor Room Conditions', 'Disappointing Rooms', 'Terrible Accommodation'],
-                'neutral': ['Average Rooms', 'Standard Accommodation', 'Decent Room']
-            },
-            'food': {
-                'positive': ['Excellent Dining', 'Amazing Breakfast', 'Outstanding Food'],
-                'negative': ['Poor Food Quality', 'Disappointing Breakfast', 'Terrible Dining'],
-                'neutral': ['Average Food', 'Standard Dining', 'Decent Breakfast']
-            },
-            'location': {
-                'positive': ['Perfect Location', 'Excellent Area', 'Great Location Choice'],
-                'negative': ['Poor Location', 'Disappointing Area', 'Bad Location'],
-                'neutral': ['Average Location', 'Standard Area', 'Decent Location']
-            },
-            'cleanliness': {
-                'positive': ['Spotless Hotel', 'Excellent Cleanliness', 'Very Clean'],
-                'negative': ['Poor Hygiene', 'Dirty Conditions', 'Cleanliness Issues'],
-                'neutral': ['Average Cleanliness', 'Standard Hygiene', 'Decent Cleaning']
-            },
-            'value': {
-                'positive': ['Excellent Value', 'Great Price Point', 'Worth Every Penny'],
-                'negative': ['Poor Value', 'Overpriced Stay', 'Not Worth Money'],
-                'neutral': ['Average Value', 'Fair Pricing', 'Decent Value']
-            },
-            'amenities': {
-                'positive': ['Great Amenities', 'Excellent Facilities', 'Amazing Features'],
-                'negative': ['Poor Amenities', 'Disappointing Facilities', 'Lacking Features'],
-                'neutral': ['Average Amenities', 'Standard Facilities', 'Decent Features']
-            },
-            'comfort': {
-                'positive': ['Very Comfortable', 'Extremely Relaxing', 'Perfect Comfort'],
-                'negative': ['Uncomfortable Stay', 'Poor Comfort', 'Unpleasant Experience'],
-                'neutral': ['Average Comfort', 'Standard Relaxation', 'Decent Comfort']
-            }
-        }
-        
-        import random
         sentiment_key = sentiment if sentiment in ['positive', 'negative', 'neutral'] else 'neutral'
         
-        if aspect in aspect_titles:
-            titles = aspect_titles[aspect][sentiment_key]
-            return random.choice(titles)
+        if aspect in _ASPECT_TITLES:
+            titles = _ASPECT_TITLES[aspect][sentiment_key]
+            return _pick(titles, text)
         
         return self._get_sentiment_title(sentiment)
 
 
 class ReviewTitleGeneratorAgent:
+    _TITLE_PATTERN = re.compile(r'Title:\s*(.+)')
+    
     def __init__(self):
         self.name = "ReviewTitleGenerator"
         self.role = "Title Generation Specialist"
         self.goal = "Generate concise, meaningful titles for hotel reviews"
         self.backstory = "Expert in creating catchy, informative titles that capture the essence of customer reviews"
         self.tools = [TitleGenerationTool()]
-        self.agent = self._create_agent()
+        self._agent = None
+    
+    @property
+    def agent(self) -> Agent:
+        """Lazily built CrewAI agent"""
+        if self._agent is None:
+            self._agent = self._create_agent()
+        return self._agent
     
     def _create_agent(self) -> Agent:
         return Agent(
@@ -420,11 +468,11 @@ class ReviewTitleGeneratorAgent:
     def generate_title(self, review_text: str, sentiment: str = None) -> Dict[str, Any]:
         """Direct title generation without CrewAI workflow"""
         try:
-            tool = TitleGenerationTool()
+            tool = self.tools[0]
             result = tool._run(review_text, sentiment)
             
             # Parse result
-            title_match = re.search(r'Title:\s*(.+)', result)
+            title_match = self._TITLE_PATTERN.search(result)
             title = title_match.group(1).strip() if title_match else 'Untitled Review'
             
             # Ensure title is reasonable length
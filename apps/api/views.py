@@ -9,6 +9,7 @@ from django.views.decorators.csrf import csrf_exempt
 from django.utils.decorators import method_decorator
 from django.core.paginator import Paginator
 from django.db.models import Count, Avg, Q
+from django.db.models.functions import TruncDate
 from django.utils import timezone
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
@@ -218,19 +219,28 @@ class AnalyticsViewSet(viewsets.ViewSet):
             end_date = datetime.now().date()
             start_date = end_date - timedelta(days=30)
             
+            # One grouped query for all days instead of several counts per day
+            daily_stats = Review.objects.filter(
+                created_at__date__range=(start_date, end_date)
+            ).annotate(
+                day=TruncDate('created_at')
+            ).values('day').annotate(
+                total=Count('id'),
+                avg=Avg('ai_score'),
+                positive=Count('id', filter=Q(sentiment='positive')),
+                negative=Count('id', filter=Q(sentiment='negative'))
+            ).order_by('day')
+            
             trends = []
-            current_date = start_date
-            while current_date <= end_date:
-                daily_reviews = Review.objects.filter(created_at__date=current_date)
-                if daily_reviews.exists():
-                    trends.append({
-                        'date': current_date.isoformat(),
-                        'total_reviews': daily_reviews.count(),
-                        'average_score': daily_reviews.aggregate(avg=Avg('ai_score'))['avg'] or 0,
-                        'positive_percentage': daily_reviews.filter(sentiment='positive').count() / daily_reviews.count() * 100 if daily_reviews.count() > 0 else 0,
-                        'negative_percentage': daily_reviews.filter(sentiment='negative').count() / daily_reviews.count() * 100 if daily_reviews.count() > 0 else 0
-                    })
-                current_date += timedelta(days=1)
+            for day in daily_stats:
+                percent_per_review = 100.0 / day['total']
+                trends.append({
+                    'date': day['day'].isoformat(),
+                    'total_reviews': day['total'],
+                    'average_score': day['avg'] or 0,
+                    'positive_percentage': day['positive'] * percent_per_review,
+                    'negative_percentage': day['negative'] * percent_per_review
+                })
             
             analytics_data = {
                 'overview': {
@@ -308,16 +318,15 @@ class ProcessReviewsAPIView(APIView):
             
             # Limit batch size for performance (can be adjusted)
             batch_size = min(20, reviews.count())
-            reviews_to_process = reviews[:batch_size]
+            reviews_to_process = list(reviews[:batch_size])
+            
+            # Stage 1: Core processing only (sentiment + score), scored in one batch
+            results = orchestrator.process_reviews([
+                {'text': review.text, 'id': str(review.id)} for review in reviews_to_process
+            ])
             
-            for review in reviews_to_process:
+            for review, result in zip(reviews_to_process, results):
                 try:
-                    # Stage 1: Core processing only (sentiment + score)
-                    result = orchestrator.process_single_review(
-                        review_text=review.text,
-                        review_id=str(review.id)
-                    )
-                    
                     # Update review with agent results
                     analysis = result['analysis']
                     
@@ -461,17 +470,22 @@ class SearchAPIView(APIView):
         
         reviews = Review.objects.filter(q_objects)[:20]
         
-        return [
-            {
+        # Lowercase keywords once rather than per review
+        keywords_lower = [(k, k.lower()) for k in keywords]
+        
+        results = []
+        for review in reviews:
+            text_lower = review.text.lower()
+            results.append({
                 'id': str(review.id),
                 'text': review.text[:200] + '...' if len(review.text) > 200 else review.text,
                 'sentiment': review.sentiment,
                 'score': review.ai_score,
                 'hotel': review.hotel.name,
-                'matched_keywords': [k for k in keywords if k.lower() in review.text.lower()]
-            }
-            for review in reviews
-        ]
+                'matched_keywords': [k for k, k_lower in keywords_lower if k_lower in text_lower]
+            })
+        
+        return results
     
     def _filter_search(self, criteria):
         """Perform filtered search"""
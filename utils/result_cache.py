@@ -0,0 +1,37 @@
+"""
+In-process LRU cache for agent results, keyed by a digest of the input
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Optional
+
+
+class DigestLRUCache:
+    """Thread-safe LRU cache whose keys are blake2b digests, so large inputs are never held in memory"""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(data: bytes) -> str:
+        """Digest of the raw input, used as the cache key"""
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None on a miss"""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+        return None
+
+    def put(self, key: str, value: Any) -> None:
+        """Store a value, evicting the least recently used entry when full"""
+        with self._lock:
+            self._entries[key] = value
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)